@@ -2,7 +2,6 @@
 
 import asyncio
 import subprocess
-import sys
 
 import typer
 from rich.console import Console
@@ -37,12 +36,43 @@ def rollback(
     console.print("[green]Rollback complete![/green]")
 
 
+# Batches above this size bypass the ORM and go through asyncpg COPY
+SEED_COPY_THRESHOLD = 100
+
+
+async def insert_seed_users(session, users) -> None:
+    """Insert seed users, routing large batches through asyncpg COPY.
+
+    COPY streams the whole batch in a single protocol round-trip instead
+    of one INSERT per row, so it scales to large seed files. Small batches
+    stay on the ORM path where per-row overhead is negligible.
+    """
+    if len(users) <= SEED_COPY_THRESHOLD:
+        session.add_all(users)
+        return
+
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    pg = raw.driver_connection
+    await pg.copy_records_to_table(
+        "users",
+        records=[
+            (u.email, u.hashed_password, u.full_name, u.is_active, u.is_superuser)
+            for u in users
+        ],
+        columns=["email", "hashed_password", "full_name", "is_active", "is_superuser"],
+    )
+    # COPY goes through the raw driver, so no session event fires and the
+    # identity map stays empty; without this flag the conditional commit in
+    # DatabaseSessionManager.session() would ROLLBACK the whole batch away
+    session.info["writes"] = True
+
+
 @app.command()
 def seed() -> None:
     """Seed the database with initial data."""
 
     async def run_seed() -> None:
-        sys.path.insert(0, "src")
         from app.core.config import get_settings
         from app.models.postgres.database import DatabaseSessionManager
         from app.models.postgres.user import User
@@ -61,15 +91,17 @@ def seed() -> None:
                 console.print("[yellow]Admin user already exists, skipping seed.[/yellow]")
                 return
 
-            # Add seed data
-            admin_user = User(
-                email="admin@example.com",
-                hashed_password="hashed_password_here",  # TODO: Hash in production
-                full_name="Admin User",
-                is_active=True,
-                is_superuser=True,
-            )
-            session.add(admin_user)
+            # Seed data (extend this list for larger fixtures)
+            seed_users = [
+                User(
+                    email="admin@example.com",
+                    hashed_password="hashed_password_here",  # TODO: Hash in production
+                    full_name="Admin User",
+                    is_active=True,
+                    is_superuser=True,
+                ),
+            ]
+            await insert_seed_users(session, seed_users)
 
         await db_manager.close()
         console.print("[green]Database seeded successfully![/green]")
@@ -1,10 +1,28 @@
 """Typer CLI entry point."""
 
+import sys
+from pathlib import Path
+
 import typer
 from rich.console import Console
 
 from commands import db, server
 
+
+def _bootstrap() -> None:
+    """Make the application package importable, once per process.
+
+    Commands used to each insert "src" on sys.path and re-import settings;
+    doing it here keeps CLI startup to a single path insertion and lets
+    get_settings()'s lru_cache handle the rest.
+    """
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
+
+
+_bootstrap()
+
 # Create main CLI app
 app = typer.Typer(
     name="fastapi-skeleton",
@@ -22,21 +40,25 @@ console = Console()
 @app.command()
 def version() -> None:
     """Show application version."""
-    import sys
+    import importlib.metadata
 
-    sys.path.insert(0, "src")
-    from app.core.config import get_settings
+    # Installed package metadata is enough here and avoids importing the
+    # pydantic settings stack just to print a version string
+    try:
+        pkg_version = importlib.metadata.version("fastapi-skeleton")
+    except importlib.metadata.PackageNotFoundError:
+        from app.core.config import get_settings
 
-    settings = get_settings()
-    console.print(f"[bold]{settings.app_name}[/bold] v{settings.app_version}")
+        settings = get_settings()
+        console.print(f"[bold]{settings.app_name}[/bold] v{settings.app_version}")
+        return
+
+    console.print(f"[bold]fastapi-skeleton[/bold] v{pkg_version}")
 
 
 @app.command()
 def info() -> None:
     """Show application configuration info."""
-    import sys
-
-    sys.path.insert(0, "src")
     from app.core.config import get_settings
 
     settings = get_settings()
@@ -9,23 +9,31 @@ from app.core.config import get_settings
 
 router = APIRouter()
 
+# Settings are immutable at runtime, so build the healthy response once at
+# import instead of re-reading settings and re-validating a model on every
+# probe — this endpoint is hammered by load balancers and k8s.
+_settings = get_settings()
+
+# Built once so per-request work is just executing the cached statement
+_PING = text("SELECT 1")
+_HEALTHY = HealthResponse(
+    status="healthy",
+    version=_settings.app_version,
+    environment=_settings.environment,
+)
+
 
 @router.get("", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Basic health check endpoint."""
-    settings = get_settings()
-    return HealthResponse(
-        status="healthy",
-        version=settings.app_version,
-        environment=settings.environment,
-    )
+    return _HEALTHY
 
 
 @router.get("/db")
 async def db_health_check(db: DBSession) -> dict:
     """Database health check endpoint."""
     try:
-        await db.execute(text("SELECT 1"))
+        await db.execute(_PING)
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "database": str(e)}
@@ -42,7 +50,7 @@ async def readiness_check(db: DBSession) -> dict:
 
     # Check database
     try:
-        await db.execute(text("SELECT 1"))
+        await db.execute(_PING)
         checks["database"] = True
     except Exception:
         pass
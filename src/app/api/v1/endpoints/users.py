@@ -1,6 +1,6 @@
 """User endpoints using UserService for business logic."""
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from app.common.dependencies import PaginationParams, UserServiceDep
 from app.schemas.user import UserCreate, UserListResponse, UserResponse, UserUpdate
@@ -12,15 +12,41 @@ router = APIRouter()
 async def list_users(
     service: UserServiceDep,
     pagination: PaginationParams,
+    after_id: int | None = Query(
+        default=None,
+        ge=1,
+        description="Keyset cursor: return users with IDs after this value",
+    ),
 ) -> UserListResponse:
-    """List all users with pagination."""
-    users, total = await service.list(
-        offset=pagination.offset,
-        limit=pagination.limit,
-    )
+    """List all users with pagination.
+
+    Passing after_id switches to keyset pagination, which stays fast at
+    any paging depth; total then reflects the returned page only.
+    """
+    if after_id is not None:
+        users = await service.list_keyset(after_id=after_id, limit=pagination.limit)
+        total = len(users)
+    else:
+        users, total = await service.list(
+            offset=pagination.offset,
+            limit=pagination.limit,
+        )
 
+    # Rows came straight from typed ORM columns, so skip the validator
+    # chain with model_construct — this loop is the hot path on large pages
     return UserListResponse(
-        items=[UserResponse.model_validate(user) for user in users],
+        items=[
+            UserResponse.model_construct(
+                id=user.id,
+                email=user.email,
+                full_name=user.full_name,
+                is_active=user.is_active,
+                is_superuser=user.is_superuser,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+            for user in users
+        ],
         total=total,
     )
 
@@ -1,13 +1,30 @@
 """Shared FastAPI dependencies."""
 
+from contextvars import ContextVar
 from typing import Annotated
 
-from fastapi import Depends, Query, Request
+from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.exceptions import BadRequestException
 from app.models.postgres.database import get_db
+from app.models.postgres.user import User
 from app.services.user_service import UserService
 
+# Sortable columns resolved to mapped attributes once at import — O(1)
+# lookup per request and no getattr-based column resolution downstream
+USER_SORT_COLUMNS = {
+    "id": User.id,
+    "email": User.email,
+    "full_name": User.full_name,
+    "created_at": User.created_at,
+    "updated_at": User.updated_at,
+}
+
+# Set per request by LoggingMiddleware; readable from anywhere (including
+# non-request code like logging) without touching request.state
+REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="unknown")
+
 
 # Type alias for database session dependency
 DBSession = Annotated[AsyncSession, Depends(get_db)]
@@ -22,9 +39,9 @@ def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
-async def get_request_id(request: Request) -> str:
-    """Get the request ID from the request state."""
-    return getattr(request.state, "request_id", "unknown")
+async def get_request_id() -> str:
+    """Get the current request ID."""
+    return REQUEST_ID.get()
 
 
 RequestID = Annotated[str, Depends(get_request_id)]
@@ -33,6 +50,10 @@ RequestID = Annotated[str, Depends(get_request_id)]
 class Pagination:
     """Pagination parameters dependency."""
 
+    # Instantiated once per request — slots keep the instance small and
+    # make attribute access a fixed-offset load instead of a dict lookup
+    __slots__ = ("page", "page_size", "offset", "limit")
+
     def __init__(
         self,
         page: int = Query(default=1, ge=1, description="Page number"),
@@ -50,6 +71,8 @@ PaginationParams = Annotated[Pagination, Depends()]
 class SortParams:
     """Sorting parameters dependency."""
 
+    __slots__ = ("sort_by", "sort_order", "is_descending", "column")
+
     def __init__(
         self,
         sort_by: str = Query(default="id", description="Field to sort by"),
@@ -57,9 +80,14 @@ class SortParams:
             default="asc", pattern="^(asc|desc)$", description="Sort order (asc/desc)"
         ),
     ) -> None:
+        column = USER_SORT_COLUMNS.get(sort_by)
+        if column is None:
+            raise BadRequestException(f"Cannot sort by '{sort_by}'")
+
         self.sort_by = sort_by
         self.sort_order = sort_order
         self.is_descending = sort_order == "desc"
+        self.column = column
 
 
 SortingParams = Annotated[SortParams, Depends()]
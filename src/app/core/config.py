@@ -33,6 +33,10 @@ class Settings(BaseSettings):
     )
     db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
     db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    # Development-only knob: echoing SQL stringifies every statement and
+    # its parameters through Python logging, which is order-of-magnitude
+    # expensive — keep it decoupled from DEBUG
+    db_echo: bool = Field(default=False, alias="DB_ECHO")
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
@@ -1,5 +1,6 @@
 """Application lifespan event handlers."""
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -7,7 +8,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.core.config import get_settings
-from app.core.logging_config import setup_logging
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.models.postgres.database import db_manager
 
 logger = logging.getLogger("app")
@@ -34,6 +35,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.db_manager = db_manager
     logger.info("Database connection pool initialized")
 
+    # Warm the pool so the first requests don't pay the connect/TLS/auth
+    # handshake; opening pool_size connections at once seeds them all
+    connections = await asyncio.gather(
+        *(db_manager.engine.connect() for _ in range(settings.db_pool_size))
+    )
+    await asyncio.gather(*(conn.close() for conn in connections))
+    logger.info(f"Connection pool warmed with {settings.db_pool_size} connections")
+
     # Add any other startup tasks here:
     # - Cache initialization (Redis)
     # - Message queue connections
@@ -52,7 +61,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Add any other shutdown tasks here:
     # - Close cache connections
-    # - Flush logs
     # - Graceful service shutdown
 
     logger.info("Application shutdown complete")
+
+    # Stop log queue listeners last so shutdown messages still get written
+    shutdown_logging()
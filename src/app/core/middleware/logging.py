@@ -1,86 +1,156 @@
 """Request/Response logging middleware."""
 
+import logging
 import time
-import uuid
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.common.dependencies import REQUEST_ID
 from app.core.logging_config import get_access_logger, get_error_logger
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses in JSON format."""
+from app.core.request_id import new_request_id
+
+# Loggers are process-wide singletons; bind them once at import
+_ACCESS = get_access_logger()
+_ERROR = get_error_logger()
+
+# Static payload keys shared by every request, zipped against the values
+# so the dict is built in one pass instead of key-by-key
+_ACCESS_KEYS = (
+    "request_id",
+    "client_ip",
+    "method",
+    "url",
+    "path",
+    "user_agent",
+    "status_code",
+    "duration_ms",
+)
+_ERROR_KEYS = (
+    "request_id",
+    "client_ip",
+    "method",
+    "url",
+    "path",
+    "user_agent",
+    "duration_ms",
+    "error",
+)
+
+
+class LoggingMiddleware:
+    """Pure ASGI middleware for logging HTTP requests and responses in JSON.
+
+    Implemented directly against the ASGI interface instead of
+    BaseHTTPMiddleware, which spawns an extra task and a pair of memory
+    streams (and builds Request/Response objects) for every request.
+    """
+
+    __slots__ = ("app",)
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
-        self.access_logger = get_access_logger()
-        self.error_logger = get_error_logger()
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log access/errors."""
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Record start time
-        start_time = time.perf_counter()
-
-        # Extract request info
-        client_ip = request.client.host if request.client else "unknown"
-        method = request.method
-        url = str(request.url)
-        path = request.url.path
-        user_agent = request.headers.get("user-agent", "unknown")
+        # Generate request ID
+        request_id = new_request_id()
+        REQUEST_ID.set(request_id)
+        # Keep request.state.request_id working for existing consumers
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        # Record start time; monotonic_ns returns an int, so no float is
+        # boxed until a log branch actually needs the duration
+        start_ns = time.monotonic_ns()
+
+        # Extract request info straight from the scope — no Request object
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        method = scope["method"]
+        path = scope["path"]
+        query_string = scope.get("query_string", b"")
+        # Single pass over the raw header list; ASGI guarantees lowercase
+        # names, so no MultiDict materialization or case folding is needed.
+        # Decoding is deferred to the log-enabled branches.
+        user_agent = b"unknown"
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value
+                break
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                message.setdefault("headers", []).append(
+                    (b"x-request-id", request_id.encode("latin-1"))
+                )
+            await send(message)
 
         try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Log access
-            self.access_logger.info(
-                "Request completed",
-                extra={
-                    "extra_data": {
-                        "request_id": request_id,
-                        "client_ip": client_ip,
-                        "method": method,
-                        "url": url,
-                        "path": path,
-                        "user_agent": user_agent,
-                        "status_code": response.status_code,
-                        "duration_ms": round(duration_ms, 2),
-                    }
-                },
-            )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            return response
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as exc:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
             # Log error
-            self.error_logger.error(
-                f"Request failed: {exc!s}",
-                exc_info=True,
+            if _ERROR.isEnabledFor(logging.ERROR):
+                duration_ms = (time.monotonic_ns() - start_ns) * 1e-6
+                url = path + (
+                    "?" + query_string.decode("latin-1") if query_string else ""
+                )
+                _ERROR.error(
+                    "Request failed: %s",
+                    exc,
+                    exc_info=True,
+                    extra={
+                        "extra_data": dict(
+                            zip(
+                                _ERROR_KEYS,
+                                (
+                                    request_id,
+                                    client_ip,
+                                    method,
+                                    url,
+                                    path,
+                                    user_agent.decode("latin-1"),
+                                    round(duration_ms, 2),
+                                    str(exc),
+                                ),
+                            )
+                        )
+                    },
+                )
+            raise
+
+        # Log access; skip the payload build entirely when below level
+        if _ACCESS.isEnabledFor(logging.INFO):
+            duration_ms = (time.monotonic_ns() - start_ns) * 1e-6
+            # URL string is only materialized when a record is emitted
+            url = path + (
+                "?" + query_string.decode("latin-1") if query_string else ""
+            )
+            _ACCESS.info(
+                "Request completed",
                 extra={
-                    "extra_data": {
-                        "request_id": request_id,
-                        "client_ip": client_ip,
-                        "method": method,
-                        "url": url,
-                        "path": path,
-                        "user_agent": user_agent,
-                        "duration_ms": round(duration_ms, 2),
-                        "error": str(exc),
-                    }
+                    "extra_data": dict(
+                        zip(
+                            _ACCESS_KEYS,
+                            (
+                                request_id,
+                                client_ip,
+                                method,
+                                url,
+                                path,
+                                user_agent.decode("latin-1"),
+                                status_code,
+                                round(duration_ms, 2),
+                            ),
+                        )
+                    )
                 },
             )
-            raise
@@ -0,0 +1,28 @@
+"""Password hashing helpers."""
+
+import asyncio
+
+import bcrypt
+
+# Work factor 12 keeps hashing deliberately slow (~200ms); anything that
+# slow must never run on the event loop
+_BCRYPT_ROUNDS = 12
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt without blocking the event loop.
+
+    The CPU-bound bcrypt call runs in a worker thread via asyncio.to_thread
+    so concurrent requests keep being served while it burns.
+    """
+    hashed = await asyncio.to_thread(
+        bcrypt.hashpw, password.encode(), bcrypt.gensalt(_BCRYPT_ROUNDS)
+    )
+    return hashed.decode()
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """Check a password against its bcrypt hash in a worker thread."""
+    return await asyncio.to_thread(
+        bcrypt.checkpw, password.encode(), hashed.encode()
+    )
@@ -28,26 +28,33 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Add middleware (order matters - last added is first executed)
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] if settings.debug else [],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Add middleware (order matters - last added is first executed).
+    # CORS is only needed for local browser development; production CORS
+    # belongs on the fronting gateway (nginx/ALB), so non-debug deploys
+    # skip the middleware frame entirely.
+    if settings.debug:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
     app.add_middleware(LoggingMiddleware)
 
     # Include routers
     app.include_router(create_root_router())
 
-    # Root endpoint
+    # Root endpoint; the closure captures plain strings so each call
+    # avoids attribute loads on the Settings model
+    app_name, app_version = settings.app_name, settings.app_version
+
     @app.get("/", tags=["root"])
     async def root() -> dict:
         """Root endpoint returning application info."""
         return {
-            "name": settings.app_name,
-            "version": settings.app_version,
+            "name": app_name,
+            "version": app_version,
             "status": "running",
         }
 
@@ -14,6 +14,10 @@ class Base(DeclarativeBase):
     Provides common columns and utilities for all models.
     """
 
+    # Fetch server-generated defaults (created_at/updated_at) with the
+    # INSERT/UPDATE via RETURNING instead of a follow-up SELECT or refresh
+    __mapper_args__ = {"eager_defaults": True}
+
     # Common columns for all models
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(
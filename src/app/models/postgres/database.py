@@ -3,16 +3,49 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+from sqlalchemy import TextClause, event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 
 
+@event.listens_for(Session, "do_orm_execute")
+def _track_writes(execute_state) -> None:
+    """Flag sessions that execute DML.
+
+    Identity-map state (new/dirty/deleted) misses bulk UPDATE/DELETE
+    statements, so this marks any non-SELECT execution; read-only
+    sessions can then skip the COMMIT round-trip.
+
+    Writes issued through the raw driver connection (e.g. asyncpg COPY)
+    bypass session events entirely — those call sites must set
+    session.info["writes"] = True themselves.
+    """
+    statement = execute_state.statement
+    if isinstance(statement, TextClause):
+        # is_select is always False for textual SQL, which would force the
+        # text("SELECT 1") health pings onto the commit path. Sniff the
+        # leading keyword instead; anything unrecognized (including
+        # WITH-prefixed selects) is treated as a write, which only costs a
+        # spare COMMIT, never loses data.
+        if statement.text.lstrip()[:6].lower() != "select":
+            execute_state.session.info["writes"] = True
+    elif not execute_state.is_select:
+        execute_state.session.info["writes"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush_writes(session: Session, flush_context) -> None:
+    """Flag sessions whose flush emitted DML (add/flush call sites)."""
+    session.info["writes"] = True
+
+
 class DatabaseSessionManager:
     """
     Manages database connections and sessions.
@@ -30,10 +63,15 @@ class DatabaseSessionManager:
 
         self._engine = create_async_engine(
             database_url,
-            echo=settings.debug,
+            echo=settings.db_echo,
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
             pool_pre_ping=True,  # Enable connection health checks
+            pool_recycle=1800,  # Retire connections before server/LB timeouts
+            pool_use_lifo=True,  # Prefer recently used (warm) connections
+            # Let asyncpg reuse server-side prepared statements across
+            # requests instead of re-parsing/planning every query
+            connect_args={"prepared_statement_cache_size": 512},
         )
 
         self._sessionmaker = async_sessionmaker(
@@ -65,7 +103,19 @@ class DatabaseSessionManager:
         session = self._sessionmaker()
         try:
             yield session
-            await session.commit()
+            # Read-only requests (typical GETs) have nothing to COMMIT;
+            # ROLLBACK drops the snapshot without forcing WAL work.
+            # Raw-driver writers (asyncpg COPY etc.) are invisible to every
+            # check below and must set session.info["writes"] themselves
+            if (
+                session.info.get("writes")
+                or session.new
+                or session.dirty
+                or session.deleted
+            ):
+                await session.commit()
+            else:
+                await session.rollback()
         except Exception:
             await session.rollback()
             raise
@@ -86,10 +136,34 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for getting database sessions.
 
+    Inlines the session lifecycle instead of wrapping
+    db_manager.session(), saving one generator/context-manager layer on
+    every request; db_manager.session() remains for non-FastAPI callers.
+
     Usage:
         @app.get("/users")
         async def get_users(db: AsyncSession = Depends(get_db)):
             ...
     """
-    async with db_manager.session() as session:
+    sessionmaker = db_manager._sessionmaker
+    if sessionmaker is None:
+        raise RuntimeError("DatabaseSessionManager is not initialized")
+
+    session = sessionmaker()
+    try:
         yield session
+        # Same read-only fast path as DatabaseSessionManager.session()
+        if (
+            session.info.get("writes")
+            or session.new
+            or session.dirty
+            or session.deleted
+        ):
+            await session.commit()
+        else:
+            await session.rollback()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
@@ -1,5 +1,6 @@
 """Email provider for sending emails via SMTP or third-party services."""
 
+import asyncio
 import logging
 import smtplib
 from email.mime.multipart import MIMEMultipart
@@ -55,21 +56,57 @@ class EmailProvider(BaseProvider):
         self.from_email = getattr(settings, "smtp_from_email", "noreply@example.com")
         self.use_tls = getattr(settings, "smtp_use_tls", True)
 
+    def _connect(self, timeout: float | None = None) -> smtplib.SMTP:
+        """Open, secure, and authenticate an SMTP connection."""
+        server = smtplib.SMTP(self.host, self.port, timeout=timeout)
+        if self.use_tls:
+            server.starttls()
+        if self.user and self.password:
+            server.login(self.user, self.password)
+        return server
+
+    def _build_message(self, to: str, subject: str, body: str, html: bool) -> MIMEMultipart:
+        """Build a MIME message for a single recipient."""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = self.from_email
+        msg["To"] = to
+
+        content_type = "html" if html else "plain"
+        msg.attach(MIMEText(body, content_type))
+        return msg
+
+    def _health_check_sync(self) -> bool:
+        """Blocking SMTP reachability probe."""
+        try:
+            with self._connect(timeout=5):
+                pass
+            return True
+        except Exception as e:
+            self.logger.error(f"Email health check failed: {e}")
+            return False
+
     async def health_check(self) -> bool:
         """Check if SMTP server is reachable.
 
         Returns:
             True if SMTP connection succeeds
         """
+        return await asyncio.to_thread(self._health_check_sync)
+
+    def _send_sync(self, to: str, subject: str, body: str, html: bool) -> bool:
+        """Blocking single-message send."""
         try:
-            with smtplib.SMTP(self.host, self.port, timeout=5) as server:
-                if self.use_tls:
-                    server.starttls()
-                if self.user and self.password:
-                    server.login(self.user, self.password)
+            msg = self._build_message(to, subject, body, html)
+
+            with self._connect() as server:
+                server.sendmail(self.from_email, [to], msg.as_string())
+
+            self.logger.info(f"Email sent to {to}: {subject}")
             return True
+
         except Exception as e:
-            self.logger.error(f"Email health check failed: {e}")
+            self.logger.error(f"Failed to send email to {to}: {e}")
             return False
 
     async def send_email(
@@ -90,28 +127,35 @@ class EmailProvider(BaseProvider):
         Returns:
             True if email was sent successfully
         """
-        try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self.from_email
-            msg["To"] = to
-
-            content_type = "html" if html else "plain"
-            msg.attach(MIMEText(body, content_type))
-
-            with smtplib.SMTP(self.host, self.port) as server:
-                if self.use_tls:
-                    server.starttls()
-                if self.user and self.password:
-                    server.login(self.user, self.password)
-                server.sendmail(self.from_email, [to], msg.as_string())
-
-            self.logger.info(f"Email sent to {to}: {subject}")
-            return True
+        return await asyncio.to_thread(self._send_sync, to, subject, body, html)
 
+    def _send_bulk_sync(
+        self,
+        recipients: list[str],
+        subject: str,
+        body: str,
+        html: bool,
+    ) -> dict[str, bool]:
+        """Blocking bulk send over a single connection."""
+        # One connection (TCP + STARTTLS + LOGIN) for the whole batch
+        # instead of a fresh handshake per recipient
+        results: dict[str, bool] = {}
+        try:
+            with self._connect() as server:
+                for recipient in recipients:
+                    msg = self._build_message(recipient, subject, body, html)
+                    try:
+                        server.sendmail(self.from_email, [recipient], msg.as_string())
+                        results[recipient] = True
+                    except smtplib.SMTPException as e:
+                        self.logger.error(f"Failed to send email to {recipient}: {e}")
+                        results[recipient] = False
         except Exception as e:
-            self.logger.error(f"Failed to send email to {to}: {e}")
-            return False
+            self.logger.error(f"Bulk email send failed: {e}")
+            for recipient in recipients:
+                results.setdefault(recipient, False)
+
+        return results
 
     async def send_bulk_email(
         self,
@@ -131,7 +175,6 @@ class EmailProvider(BaseProvider):
         Returns:
             Dictionary mapping email addresses to success status
         """
-        results = {}
-        for recipient in recipients:
-            results[recipient] = await self.send_email(recipient, subject, body, html)
-        return results
+        return await asyncio.to_thread(
+            self._send_bulk_sync, recipients, subject, body, html
+        )
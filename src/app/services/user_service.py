@@ -1,12 +1,23 @@
 """User service for user-related business logic."""
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
 
 from app.common.exceptions import ConflictException, NotFoundException
+from app.core.security import hash_password
 from app.models.postgres.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.services.base import BaseService
 
+# Hot SELECTs built once at import — skips the per-request statement
+# construction and keeps SQLAlchemy's compiled cache on a single key
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_COUNT = select(func.count()).select_from(User)
+
+# Rows fetched per server-side cursor batch when streaming list results
+_LIST_YIELD_PER = 100
+
 
 class UserService(BaseService):
     """Service for user-related operations."""
@@ -23,8 +34,7 @@ class UserService(BaseService):
         Raises:
             NotFoundException: If user is not found
         """
-        query = select(User).where(User.id == user_id)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_USER_BY_ID, {"user_id": user_id})
         user = result.scalar_one_or_none()
 
         if not user:
@@ -41,8 +51,7 @@ class UserService(BaseService):
         Returns:
             The user object or None if not found
         """
-        query = select(User).where(User.email == email)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def list(
@@ -57,17 +66,54 @@ class UserService(BaseService):
         Returns:
             Tuple of (list of users, total count)
         """
-        # Get total count
-        count_query = select(func.count()).select_from(User)
-        total = (await self.db.execute(count_query)).scalar() or 0
+        # Single round-trip: the window function carries the total count on
+        # every page row, so no separate COUNT query (and no second pooled
+        # connection) is needed. Streaming with yield_per keeps memory
+        # bounded to one cursor batch however large the page limit grows.
+        stmt = (
+            select(User, func.count().over().label("total"))
+            .offset(offset)
+            .limit(limit)
+            .execution_options(yield_per=_LIST_YIELD_PER)
+        )
+        result = await self.db.stream(stmt)
 
-        # Get paginated users
-        query = select(User).offset(offset).limit(limit)
-        result = await self.db.execute(query)
-        users = list(result.scalars().all())
+        users: list[User] = []
+        total = 0
+        async for user, row_total in result:
+            users.append(user)
+            total = row_total
+
+        # A page past the last row returns no rows, so the window total
+        # never came back — only then fall back to a bare count
+        if not users and offset:
+            total = (await self.db.execute(_USER_COUNT)).scalar() or 0
 
         return users, total
 
+    async def list_keyset(
+        self, after_id: int | None = None, limit: int = 10
+    ) -> "list[User]":  # quoted: the list() method above shadows the builtin here
+        """List users with keyset pagination.
+
+        Unlike OFFSET paging, which scans and discards every prior row,
+        this seeks through the primary-key index and stays O(limit) no
+        matter how deep the client pages.
+
+        Args:
+            after_id: Only return users with IDs greater than this value
+            limit: Maximum number of records to return
+
+        Returns:
+            List of users ordered by ID
+        """
+        stmt = select(User).order_by(User.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(User.id > after_id)
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def create(self, data: UserCreate) -> User:
         """Create a new user.
 
@@ -80,20 +126,20 @@ class UserService(BaseService):
         Raises:
             ConflictException: If email already exists
         """
-        # Check if email already exists
-        existing = await self.get_by_email(data.email)
-        if existing:
-            raise ConflictException("User with this email already exists")
-
-        # Create user (password should be hashed in production)
+        # Let the unique index on email enforce uniqueness: the happy path
+        # is a single INSERT, and a violation maps to the 409. No separate
+        # existence probe, and no dialect-specific upsert clause needed.
         user = User(
             email=data.email,
-            hashed_password=data.password,  # TODO: Hash password
+            hashed_password=await hash_password(data.password),
             full_name=data.full_name,
         )
         self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
+
+        try:
+            await self.db.flush()
+        except IntegrityError as exc:
+            raise ConflictException("User with this email already exists") from exc
 
         return user
 
@@ -110,18 +156,33 @@ class UserService(BaseService):
         Raises:
             NotFoundException: If user is not found
         """
-        user = await self.get_by_id(user_id)
-
-        # Update fields
         update_data = data.model_dump(exclude_unset=True)
         if "password" in update_data:
-            update_data["hashed_password"] = update_data.pop("password")  # TODO: Hash
-
-        for field, value in update_data.items():
-            setattr(user, field, value)
+            update_data["hashed_password"] = await hash_password(
+                update_data.pop("password")
+            )
+
+        # No fields to change — just return the current row
+        if not update_data:
+            return await self.get_by_id(user_id)
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh:
+        # one round-trip, and the returned row carries the server-side
+        # updated_at without an extra SELECT.
+        # synchronize_session=False skips the identity-map sweep; sessions
+        # are request-scoped here, so there are no stale instances to fix up
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
 
-        await self.db.flush()
-        await self.db.refresh(user)
+        if user is None:
+            raise NotFoundException("User")
 
         return user
 
@@ -134,5 +195,14 @@ class UserService(BaseService):
         Raises:
             NotFoundException: If user is not found
         """
-        user = await self.get_by_id(user_id)
-        await self.db.delete(user)
+        # Single DELETE ... RETURNING instead of SELECT + DELETE
+        stmt = (
+            delete(User)
+            .where(User.id == user_id)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+
+        if result.scalar_one_or_none() is None:
+            raise NotFoundException("User")
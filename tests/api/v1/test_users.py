@@ -0,0 +1,68 @@
+"""Tests for user list endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.postgres.user import User
+
+
+async def _seed_users(db_session: AsyncSession, count: int) -> list[User]:
+    """Insert users directly, bypassing the bcrypt-hashing create path."""
+    users = [
+        User(
+            email=f"user{i}@example.com",
+            hashed_password="hashed",
+            full_name=f"User {i}",
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_list_users_offset_pagination(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Test offset paging: a page of rows with the table-wide total."""
+    await _seed_users(db_session, 5)
+
+    response = await client.get("/api/v1/users", params={"page": 1, "page_size": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_list_users_keyset_pagination(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Test that after_id switches to keyset paging past the cursor."""
+    users = await _seed_users(db_session, 5)
+    after_id = users[1].id
+
+    response = await client.get(
+        "/api/v1/users", params={"after_id": after_id, "page_size": 2}
+    )
+    assert response.status_code == 200
+    ids = [item["id"] for item in response.json()["items"]]
+    assert ids == [users[2].id, users[3].id]
+
+
+@pytest.mark.asyncio
+async def test_list_users_keyset_total_is_page_length(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Test that total means page length (not table count) under keyset paging."""
+    users = await _seed_users(db_session, 5)
+
+    response = await client.get(
+        "/api/v1/users", params={"after_id": users[2].id, "page_size": 10}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["total"] == 2
@@ -0,0 +1,71 @@
+"""Tests for database CLI seed helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cli.commands.db import SEED_COPY_THRESHOLD, insert_seed_users
+
+
+def _make_users(count: int) -> list[SimpleNamespace]:
+    """Build lightweight stand-ins for User rows."""
+    return [
+        SimpleNamespace(
+            email=f"user{i}@example.com",
+            hashed_password="hashed",
+            full_name=f"User {i}",
+            is_active=True,
+            is_superuser=False,
+        )
+        for i in range(count)
+    ]
+
+
+class _FakeSession:
+    """Session double exposing just what insert_seed_users touches."""
+
+    def __init__(self) -> None:
+        self.info: dict = {}
+        self.added: list = []
+        self.copy_records_to_table = AsyncMock()
+
+    def add_all(self, users) -> None:
+        self.added.extend(users)
+
+    async def connection(self):
+        raw = SimpleNamespace(driver_connection=self)
+        return SimpleNamespace(get_raw_connection=AsyncMock(return_value=raw))
+
+
+@pytest.mark.asyncio
+async def test_small_seed_batch_uses_orm() -> None:
+    """Batches at or below the threshold go through session.add_all."""
+    session = _FakeSession()
+    users = _make_users(SEED_COPY_THRESHOLD)
+
+    await insert_seed_users(session, users)
+
+    assert session.added == users
+    session.copy_records_to_table.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_copy_seed_batch_marks_session_as_writer() -> None:
+    """The COPY path must flag the session so the batch is committed.
+
+    COPY writes through the raw driver connection, which fires no session
+    events and leaves the identity map empty; without the writes flag the
+    conditional commit in DatabaseSessionManager.session() would classify
+    the session as read-only and ROLLBACK the entire batch.
+    """
+    session = _FakeSession()
+    users = _make_users(SEED_COPY_THRESHOLD + 1)
+
+    await insert_seed_users(session, users)
+
+    assert not session.added
+    session.copy_records_to_table.assert_awaited_once()
+    _, kwargs = session.copy_records_to_table.await_args
+    assert len(kwargs["records"]) == len(users)
+    assert session.info.get("writes") is True